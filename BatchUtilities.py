@@ -1,27 +1,167 @@
+import itertools
+import os
+import shutil
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# Path to the Blender executable - override with the BLENDER_EXE environment variable to make scripts portable
+BLENDER_EXE = os.environ.get("BLENDER_EXE", "C:\\Program Files\\Blender Foundation\\Blender 3.3\\blender.exe")
+
+# Number of GPUs to spread batch workers over - override with the GPU_COUNT environment variable
+GPU_COUNT = max(int(os.environ.get("GPU_COUNT", "1")), 1)
+
+# Buffer size in bytes for draining worker output - large enough that the many tiny
+# lines Blender prints coalesce into few big writes instead of one syscall per line
+LOG_BUFFER_SIZE = 1 << 20
+
+# Monotonic counter naming the default log files of async launches
+_async_log_count = itertools.count()
+
+
+def _runBlenderJob(cmd, log_path, gpu_id=None):
+    """
+        Helper to run a single headless Blender instance for the process pool.
+        Output is drained from a buffered pipe into a buffered log file on a separate
+        thread, so the child never deadlocks on a full pipe and the log writes
+        coalesce rather than hitting the disk one line at a time.
+
+    :param cmd: full Blender command line to run
+    :type cmd: list
+    :param log_path: path of the log file to stream this worker's stdout/stderr into
+    :type log_path: str
+    :param gpu_id: id of the GPU to pin this worker to via the GPU_ID env var, None to leave device selection to Blender
+    :type gpu_id: int
+    :return: int return code of the Blender process
+    """
+    env = os.environ.copy()
+
+    # Pin the worker to a GPU so scripts can route CYCLES_DEVICE per instance
+    if gpu_id is not None:
+        env["GPU_ID"] = str(gpu_id)
+
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=LOG_BUFFER_SIZE, env=env)
+
+    # Drain on a thread while waiting - the buffered log file only flushes when its
+    # buffer fills and once on close at process exit
+    with open(log_path, "wb", buffering=LOG_BUFFER_SIZE) as logFile:
+        drain = threading.Thread(target=shutil.copyfileobj, args=(proc.stdout, logFile, LOG_BUFFER_SIZE))
+        drain.start()
+        proc.wait()
+        drain.join()
+
+    return proc.returncode
+
 
 class BatchUtilites(object):
 
     @staticmethod
-    def runBatchProcess(python_file, args):
+    def runBatchProcess(python_file, args_list, max_workers=None, log_dir=None):
         """
             Run Blender in a headless/background state. Passing in a python file to run and custom args.
+            Each entry in args_list is dispatched to its own Blender instance, running up to
+            max_workers instances concurrently so batch jobs spread across all cores.
 
         :param python_file: Path to python file to run when blender loads"
         :type python_file: str
-        :param args: list of custom args seperated out e.g ["-renderWidth", "1024", "-rh", "1024"]
-        :type args: list
+        :param args_list: list of custom arg lists, one per Blender instance,
+        each seperated out e.g [["-renderWidth", "1024", "-rh", "1024"], ["-rw", "2048"]]
+        :type args_list: list
+        :param max_workers: number of concurrent Blender instances, defaults to the machine cpu count
+        :type max_workers: int
+        :param log_dir: directory to write per-worker log files into, defaults to the current working directory
+        :type log_dir: str
+        :return: list of int return codes, one per job in args_list order
         """
+        # Nothing to do - an empty batch must not reach the executor, which rejects 0 workers
+        if not args_list:
+            return []
+
+        # os.cpu_count() can return None when the count is undeterminable
+        if max_workers is None:
+            max_workers = min(os.cpu_count() or 1, len(args_list))
+
+        if log_dir is None:
+            log_dir = os.getcwd()
+
+        # Build one headless Blender command per job
+        cmds = []
+        for subArgs in args_list:
+            cmds.append([
+                BLENDER_EXE,
+                "--background",
+                "--python",
+                python_file,
+                "--"
+            ] + subArgs)
 
-        BlENDER_EXE = "C:\\Program Files\\Blender Foundation\\Blender 3.3\\blender.exe"
+        # Fan the jobs out over a pool of workers and collect the return codes
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = []
+            for index, cmd in enumerate(cmds):
+                logPath = os.path.join(log_dir, f"blender_worker_{index}.log")
+                # Round-robin over the available devices so job counts beyond the
+                # GPU count never pin a worker to a device that does not exist
+                futures.append(pool.submit(_runBlenderJob, cmd, logPath, gpu_id=index % GPU_COUNT))
 
-        args = [
-            BlENDER_EXE,
+            return [future.result() for future in futures]
+
+    @staticmethod
+    def runBatchProcessAsync(python_file, args, log_path=None):
+        """
+            Launch Blender in a headless/background state without blocking the caller.
+            Returns the process handle immediately so callers can fire off several renders,
+            carry on with other work and wait on completion later via waitAll.
+            Output streams to a log file - an undrained PIPE would fill and block the
+            render once the log outgrows the pipe buffer.
+
+        :param python_file: Path to python file to run when blender loads"
+        :type python_file: str
+        :param args: list of custom args seperated out e.g ["-renderWidth", "1024", "-rh", "1024"]
+        :type args: list
+        :param log_path: path of the log file to stream stdout/stderr into,
+        defaults to a numbered blender_async log in the current working directory
+        :type log_path: str
+        :return: subprocess.Popen handle of the launched Blender instance
+        """
+        cmd = [
+            BLENDER_EXE,
             "--background",
             "--python",
             python_file,
             "--"
         ] + args
 
-        subprocess.run(args)
+        if log_path is None:
+            log_path = os.path.join(os.getcwd(), f"blender_async_{next(_async_log_count)}.log")
+
+        # The child writes through its own copy of the file handle, so ours closes right away -
+        # start_new_session detaches the child from the caller's process group
+        # so a caller interrupt does not tear down in-flight renders
+        with open(log_path, "wb") as logFile:
+            return subprocess.Popen(cmd, stdout=logFile, stderr=subprocess.STDOUT, start_new_session=True)
+
+    @staticmethod
+    def waitAll(procs, timeout=None):
+        """
+            Wait for a batch of Blender processes launched with runBatchProcessAsync to finish.
+            Blocks in the OS wait call per process rather than busy-polling, so no CPU is
+            wasted while renders are in flight.
+
+        :param procs: list of subprocess.Popen handles to wait on
+        :type procs: list
+        :param timeout: overall time in seconds to wait for the whole batch, None to wait indefinitely
+        :type timeout: float
+        :return: list of int return codes, one per process in procs order
+        :raises subprocess.TimeoutExpired: if the batch does not finish within timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        for proc in procs:
+            # Pass the remaining budget down so the total wait honours the overall timeout
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+            proc.wait(timeout=remaining)
+
+        return [proc.returncode for proc in procs]
@@ -1,6 +1,13 @@
 import bpy
+import hashlib
+import json
+import numpy as np
 import os
+import shutil
+import time
+from pathlib import Path
 from Utilities.FileObjects.FilePath import FilePath
+from Utilities.Blender.MaterialUtilities import MaterialUtilities
 from Utilities.Blender.SceneUtilities import SceneUtilities
 
 
@@ -11,27 +18,261 @@ class CompositorUtilities(object):
     https://docs.blender.org/api/current/bpy.types.CompositorNode.html
     """
 
+    # Soft budget in bytes of pixel data kept alive by loaded images before a cleanup purges them
+    _image_cache_budget = 512 * 1024 * 1024
+
+    # Directory holding rendered compositor outputs keyed by content hash, reused across processes
+    _render_cache_dir = os.path.join(os.path.expanduser("~"), ".blendercache")
+
+    # Soft cap in bytes on the on-disk render cache before the least recently used entries are evicted
+    _render_cache_budget = 2 * 1024 * 1024 * 1024
+
+    @staticmethod
+    def _loadRenderCacheIndex():
+        """
+        Helper to read the render cache metadata mapping cache key -> file name, size and last use time
+        :return: dict of the cache metadata, empty when no cache exists yet
+        """
+        try:
+            with open(os.path.join(CompositorUtilities._render_cache_dir, "index.json")) as indexFile:
+                return json.load(indexFile)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _saveRenderCacheIndex(index):
+        """
+        Helper to write the render cache metadata back to disk
+        :param index: dict of the cache metadata to persist
+        :return:
+        """
+        os.makedirs(CompositorUtilities._render_cache_dir, exist_ok=True)
+        indexPath = os.path.join(CompositorUtilities._render_cache_dir, "index.json")
+
+        # Write via a per-process temp file and atomic replace - concurrent batch workers
+        # share this cache and a torn write would parse as an empty index on the next load
+        tmpPath = f"{indexPath}.{os.getpid()}.tmp"
+        with open(tmpPath, "w") as indexFile:
+            json.dump(index, indexFile)
+        os.replace(tmpPath, indexPath)
+
+    @staticmethod
+    def purgeRenderCache(budget_bytes=None):
+        """
+        Method to evict the least recently used renders from the disk cache until it fits a byte budget,
+        keeping the user's home directory from growing without bound
+        :param budget_bytes: int byte budget for the cache directory, defaults to the class budget
+        :return:
+        """
+        if budget_bytes is None:
+            budget_bytes = CompositorUtilities._render_cache_budget
+
+        index = CompositorUtilities._loadRenderCacheIndex()
+        totalBytes = sum(entry["size"] for entry in index.values())
+
+        # Evict oldest-used first until the cache fits the budget
+        for key, entry in sorted(index.items(), key=lambda item: item[1]["used"]):
+            if totalBytes <= budget_bytes:
+                break
+            try:
+                os.remove(os.path.join(CompositorUtilities._render_cache_dir, entry["file"]))
+            except OSError:
+                # The file is already gone, still drop its stale metadata
+                pass
+            totalBytes -= entry["size"]
+            del index[key]
+
+        CompositorUtilities._saveRenderCacheIndex(index)
+
+        # Cache files absent from the index - eg. orphaned by a lost concurrent index update -
+        # would otherwise stay invisible to eviction forever. Sweep them once they are old
+        # enough that no in-flight store can still be about to index them
+        indexedFiles = {entry["file"] for entry in index.values()}
+        cutoff = time.time() - 3600
+        try:
+            with os.scandir(CompositorUtilities._render_cache_dir) as entries:
+                for entry in entries:
+                    if entry.name == "index.json" or entry.name in indexedFiles:
+                        continue
+                    try:
+                        if entry.stat().st_mtime < cutoff:
+                            os.remove(entry.path)
+                    except OSError:
+                        # Another worker removed or is still writing it, leave it for the next sweep
+                        pass
+        except OSError:
+            # No cache directory yet, nothing to sweep
+            pass
+
+    @staticmethod
+    def _cacheKey(op_name, input_paths, params):
+        """
+        Helper to build a content hash identifying a compositor render -
+        any change to an input file, the operation or its parameters yields a new key
+        :param op_name: str name of the compositor operation eg. blendImages
+        :param input_paths: list of str file paths of the source images
+        :param params: dict of the operation parameters that affect the output
+        :return: str hex digest key for the render
+        """
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(op_name.encode())
+
+        for key in sorted(params):
+            hasher.update(f"{key}={params[key]}".encode())
+
+        # Fold in each input's identity, modification time and size so stale hits are impossible
+        for path in input_paths:
+            stat = os.stat(path)
+            hasher.update(f"{path}:{stat.st_mtime_ns}:{stat.st_size}".encode())
+
+        return hasher.hexdigest()
+
+    @staticmethod
+    def _fetchCachedRender(cache_key, dst):
+        """
+        Helper to satisfy a compositor render from the disk cache when an identical render was done before
+        :param cache_key: str content hash of the render from _cacheKey
+        :param dst: FilePath object of the destination image
+        :return: bool True when the cached file was copied to the destination, False on a cache miss
+        """
+        cachePath = os.path.join(CompositorUtilities._render_cache_dir, cache_key + "." + dst.fileExt)
+
+        if os.path.isfile(cachePath):
+            shutil.copyfile(cachePath, dst.getFullPath())
+
+            # Refresh the last-use time so eviction keeps hot entries around
+            index = CompositorUtilities._loadRenderCacheIndex()
+            if cache_key in index:
+                index[cache_key]["used"] = time.time()
+                CompositorUtilities._saveRenderCacheIndex(index)
+
+            return True
+
+        return False
+
+    @staticmethod
+    def _storeCachedRender(cache_key, dst):
+        """
+        Helper to store a freshly rendered output in the disk cache for reuse by later identical renders
+        :param cache_key: str content hash of the render from _cacheKey
+        :param dst: FilePath object of the rendered destination image
+        :return:
+        """
+        os.makedirs(CompositorUtilities._render_cache_dir, exist_ok=True)
+        cachePath = os.path.join(CompositorUtilities._render_cache_dir, cache_key + "." + dst.fileExt)
+        shutil.copyfile(dst.getFullPath(), cachePath)
+
+        # Record the entry's metadata and keep the cache inside its byte budget
+        index = CompositorUtilities._loadRenderCacheIndex()
+        index[cache_key] = {
+            "file": os.path.basename(cachePath),
+            "size": os.path.getsize(cachePath),
+            "used": time.time(),
+        }
+        CompositorUtilities._saveRenderCacheIndex(index)
+        CompositorUtilities.purgeRenderCache()
+
+    @staticmethod
+    def clearImageCache(budget_bytes=0):
+        """
+        Method to free image data blocks accumulated across compositor renders, capping memory on long batch runs
+        :param budget_bytes: int soft budget of pixel bytes to keep resident -
+        only purges once the estimated total exceeds it, 0 to always purge
+        :return:
+        """
+        # Estimate resident pixel bytes across all loaded images (float32 per channel)
+        if budget_bytes:
+            totalBytes = sum(img.size[0] * img.size[1] * img.channels * 4 for img in bpy.data.images)
+            if totalBytes <= budget_bytes:
+                return
+
+        # Drop the shared cache references first so the data blocks below read as unused
+        MaterialUtilities._image_cache.clear()
+
+        # Free every image no longer referenced by a node or material
+        for img in [i for i in bpy.data.images if i.users == 0]:
+            bpy.data.images.remove(img)
+
     @staticmethod
     def initCompositor(output_node_type="CompositorNodeOutputFile"):
         """
-        Method to initalise the Blender Compositor node tree with a default file output node
+        Method to initalise the Blender Compositor node tree with a default file output node,
+        reusing the existing tree and output node where possible so repeat calls in a batch
+        do not dirty the depsgraph
         :param output_node_type: str of the output node to create eg. CompositorNodeOutputFile for image file output
         :return: tuple of the compositor node tree and the output node object
         """
-        # Switch on nodes and get scene reference
-        bpy.context.scene.use_nodes = True
-        nodeTree = bpy.context.scene.node_tree
-        outputNode = nodeTree.nodes.new(type=output_node_type)
+        scene = bpy.context.scene
+
+        # Only toggle nodes on when they are off - the assignment alone invalidates the depsgraph
+        if not scene.use_nodes:
+            scene.use_nodes = True
+
+        nodeTree = scene.node_tree
+
+        # Reuse an existing output node of the requested type rather than creating a fresh one per call -
+        # callers passing do_cleanup=False keep the tree alive across a whole batch
+        outputNode = next((node for node in nodeTree.nodes if node.bl_idname == output_node_type), None)
+        if outputNode is None:
+            outputNode = nodeTree.nodes.new(type=output_node_type)
 
         return nodeTree, outputNode
 
     @staticmethod
-    def renderComposition(node_tree, do_cleanup=True, frame=0):
+    def _clearNodeTree(node_tree):
+        """
+        Helper to remove every node from the provided node tree in one pass
+        :param node_tree: Compositor node tree to clear
+        :return:
+        """
+        # clear() removes everything in a single C call instead of one update per removal
+        if hasattr(node_tree.nodes, "clear"):
+            node_tree.nodes.clear()
+        else:
+            # Snapshot first - removing while iterating the live collection skips nodes
+            for node in list(node_tree.nodes):
+                node_tree.nodes.remove(node)
+
+        # Tag the scene once after the bulk removal rather than implicitly per node
+        bpy.context.scene.update_tag()
+
+    @staticmethod
+    def _invokeRender(animation=False, compositor_only=True):
+        """
+        Helper to run the render operator with the compositor-only fast path - switches to the
+        cheapest engine for image-input-only graphs so no 3D scene sync is paid, enables
+        compositing and skips UI notifications, restoring the caller's engine afterwards
+        :param animation: bool render the scene frame range instead of a single still
+        :param compositor_only: bool the composition uses image inputs only
+        :return:
+        """
+        # Pure compositor graphs only need the node tree evaluated - Workbench skips the full
+        # engine render sync. The caller's engine is restored after so the scene is not left mutated
+        previousEngine = bpy.context.scene.render.engine
+        if compositor_only:
+            bpy.context.scene.render.engine = 'BLENDER_WORKBENCH'
+        bpy.context.scene.render.use_compositing = True
+
+        try:
+            # Render, skipping UI notifications where the override is available
+            if hasattr(bpy.context, "temp_override"):
+                with bpy.context.temp_override(window=None):
+                    bpy.ops.render.render(animation=animation, write_still=not animation, use_viewport=False)
+            else:
+                bpy.ops.render.render(animation=animation, write_still=not animation, use_viewport=False)
+        finally:
+            if compositor_only and bpy.context.scene.render.engine != previousEngine:
+                bpy.context.scene.render.engine = previousEngine
+
+    @staticmethod
+    def renderComposition(node_tree, do_cleanup=True, frame=0, compositor_only=True):
         """
         Method to render the current node tree composition to the output node
         :param node_tree: Compositor node tree to render
         :param do_cleanup: bool do clear out the node tree after rendering
         :param frame: int frame to render - will append frame number with four digit padding to output file eg. '0000'
+        :param compositor_only: bool the composition uses image inputs only -
+        switches to the cheapest render engine so no 3D scene sync is paid per render
         :return:
         """
         # Ensure a camera exists prior to rendering
@@ -44,12 +285,91 @@ class CompositorUtilities(object):
         bpy.context.scene.frame_set(frame)
 
         # Render the tmp roughness image
-        bpy.ops.render.render(write_still=True)
+        CompositorUtilities._invokeRender(compositor_only=compositor_only)
+
+        # Clean node tree and purge accumulated images once they exceed the memory budget
+        if do_cleanup:
+            CompositorUtilities._clearNodeTree(node_tree)
+            CompositorUtilities.clearImageCache(budget_bytes=CompositorUtilities._image_cache_budget)
+
+    @staticmethod
+    def renderBatch(jobs, src_output_pin=0, format='TARGA', color_mode='RGBA', do_cleanup=True):
+        """
+        Method to render a list of image jobs in one Blender render session instead of one render call per image.
+        All jobs share a single node tree and are rendered as successive frames of one animation render,
+        amortising the per-render scene sync and operator overhead across the whole batch.
+        :param jobs: list of dicts, one per image, with keys
+        'src_img' (str file path of the source image),
+        'dst_img' (str file path of the destination image) and
+        optionally 'colorspace' (str Blender colorspace name to assign to the source image eg. Non-Color)
+        :param src_output_pin: int output pin on the image input node to route to the file output eg. 0 for color, 1 for alpha
+        :param format: str file format of the output images in Blender formatted string eg. TARGA, PNG, JPEG, TIFF
+        :param color_mode: str output color mode in Blender formatted string eg. BW, RGB, RGBA
+        :param do_cleanup: bool clear the compositing node tree of all nodes after rendering
+        :return: list of FilePath objects of the rendered destination images
+        """
+        # Nothing to do - an empty batch would otherwise set an inverted frame range and render junk
+        if not jobs:
+            return []
+
+        # Switch on nodes and get scene reference
+        nodeTree, outputNode = CompositorUtilities.initCompositor()
+
+        # One shared input node - the frame handler rebinds its image per job
+        inputNode = nodeTree.nodes.new(type="CompositorNodeImage")
+
+        # Connect nodes -
+        # link the requested pin on the input node to the color pin (0) on the output node
+        nodeTree.links.new(inputNode.outputs[src_output_pin], outputNode.inputs[0])
+
+        # Assign output file type (extension) and color mode once for the whole batch
+        outputNode.format.file_format = format
+        outputNode.format.color_mode = color_mode
+
+        # Resolve destinations and load all source images up front
+        dstTexs = [FilePath(job["dst_img"]) for job in jobs]
+        srcImgs = []
+        for job in jobs:
+            srcImgs.append(MaterialUtilities.loadImage(FilePath(job["src_img"]).getFullPath(), colorspace=job.get("colorspace")))
+
+        def _bindJob(scene, depsgraph=None):
+            # Swap the input image and output path to the job matching the frame about to render
+            frame = scene.frame_current
+            if 0 <= frame < len(jobs):
+                inputNode.image = srcImgs[frame]
+                outputNode.base_path = dstTexs[frame].getFullPath(path_only=True)
+                outputNode.file_slots[0].path = dstTexs[frame].fileName
+
+        # Ensure a camera exists prior to rendering
+        if not bpy.context.scene.camera:
+            print("COMPOSITOR UTILS: creating RenderCam in active collection")
+            SceneUtilities.createCamera(name="RenderCam")
+
+        # Map one frame to one job and render the whole batch as an animation -
+        # the caller's frame range is restored after so the scene is not left mutated
+        scene = bpy.context.scene
+        previousFrameStart = scene.frame_start
+        previousFrameEnd = scene.frame_end
+        scene.frame_start = 0
+        scene.frame_end = len(jobs) - 1
+
+        bpy.app.handlers.frame_change_pre.append(_bindJob)
+        try:
+            # The batch graph is image-input-only by construction, so take the compositor fast path
+            CompositorUtilities._invokeRender(animation=True)
+        finally:
+            bpy.app.handlers.frame_change_pre.remove(_bindJob)
+            scene.frame_start = previousFrameStart
+            scene.frame_end = previousFrameEnd
 
         # Clean node tree
         if do_cleanup:
-            for node in node_tree.nodes:
-                node_tree.nodes.remove(node)
+            CompositorUtilities._clearNodeTree(nodeTree)
+
+        # Remove the per-frame Blender suffix from every output in one rename pass
+        CompositorUtilities.removeBlenderFrameSuffixes(dstTexs, frames=list(range(len(dstTexs))))
+
+        return dstTexs
 
     @staticmethod
     def removeBlenderFrameSuffix(file_path, frame=0):
@@ -59,14 +379,47 @@ class CompositorUtilities(object):
         :param frame: int the frame the image was rendered for
         :return:
         """
-        # Cleanup roughness files to one TMP file without the blender ID suffix
-        if file_path.exists():
-            # If the final destination name exists, remove it
-            file_path.removeFile()
+        # os.replace overwrites any existing destination atomically -
+        # one syscall instead of the old exists/remove/rename sequence, and no directory scan for a single file
+        tmpOutput = Path(file_path.getFullPath(path_only=True)) / f"{file_path.fileName}{frame:04d}.{file_path.fileExt}"
+        os.replace(tmpOutput, file_path.getFullPath())
 
-        # Remove Blender standard '0000' suffix
-        tmpOutput = file_path.getFullPath(path_only=True) + "/" + file_path.fileName + "0000" + "." + file_path.fileExt
-        os.rename(tmpOutput, file_path.getFullPath())
+    @staticmethod
+    def removeBlenderFrameSuffixes(file_paths, frame=0, frames=None):
+        """
+        Method to rename a batch of output files stripping off the automatic Blender render frame suffix eg. '0000',
+        scanning each output directory once instead of issuing per-file existence checks
+        :param file_paths: list of FilePath objects of the provided output files (do not include the frame suffix)
+        :param frame: int the frame all images were rendered for
+        :param frames: list of int per-file render frames, overrides frame when the batch spans multiple frames
+        :return:
+        """
+        if frames is None:
+            frames = [frame] * len(file_paths)
+
+        # Group the expected suffixed names by directory so each directory is scanned once
+        pending = {}
+        for filePath, fileFrame in zip(file_paths, frames):
+            suffixedName = filePath.fileName + str(fileFrame).zfill(4) + "." + filePath.fileExt
+            pending.setdefault(filePath.getFullPath(path_only=True), {})[suffixedName] = filePath
+
+        # One scandir per directory finds every suffixed output -
+        # os.replace overwrites any existing destination atomically, no separate exists/remove needed
+        missing = []
+        for directory, names in pending.items():
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    filePath = names.pop(entry.name, None)
+                    if filePath:
+                        os.replace(entry.path, filePath.getFullPath())
+
+            # Anything left over was never written by the render
+            missing.extend(os.path.join(directory, name) for name in names)
+
+        # Fail as loudly as the old per-file os.rename did rather than
+        # letting a partial render batch pass with stale destination files
+        if missing:
+            raise FileNotFoundError(f"Expected render outputs were not found: {missing}")
 
     @staticmethod
     def extractAlphaToGreyscale(src_img, dst_img=None, dst_suffix=None, format='TARGA', do_cleanup=True):
@@ -80,20 +433,8 @@ class CompositorUtilities(object):
         :param do_cleanup: bool clear the compositing node tree of all nodes after rendering
         :return:
         """
-        # Switch on nodes and get scene reference
-        nodeTree, outputNode = CompositorUtilities.initCompositor()
-
-        # Create input node
-        inputNode = nodeTree.nodes.new(type="CompositorNodeImage")
-
-        # Connect nodes -
-        # link the alpha pin (1) on the input node to the color pin (0) on the output node
-        nodeTree.links.new(inputNode.outputs[1], outputNode.inputs[0])
-
-        # Assign input image
+        # Resolve the source and destination paths first so a cache hit skips all node work
         srcTex = FilePath(src_img)
-        img = bpy.data.images.load(srcTex.getFullPath(), check_existing=True)
-        inputNode.image = img
 
         # Use the provided full destination file path if available
         if dst_img:
@@ -107,6 +448,27 @@ class CompositorUtilities(object):
         else:
             dstTex = FilePath(srcTex.getFullPath())
 
+        # Reuse an identical previous render from the disk cache when the input is unchanged -
+        # rendering in place overwrites the source so those calls can never hit and are not cached
+        cacheKey = None
+        if dstTex.getFullPath() != srcTex.getFullPath():
+            cacheKey = CompositorUtilities._cacheKey("extractAlphaToGreyscale", [srcTex.getFullPath()], {"format": format})
+            if CompositorUtilities._fetchCachedRender(cacheKey, dstTex):
+                return dstTex
+
+        # Switch on nodes and get scene reference
+        nodeTree, outputNode = CompositorUtilities.initCompositor()
+
+        # Create input node
+        inputNode = nodeTree.nodes.new(type="CompositorNodeImage")
+
+        # Connect nodes -
+        # link the alpha pin (1) on the input node to the color pin (0) on the output node
+        nodeTree.links.new(inputNode.outputs[1], outputNode.inputs[0])
+
+        # Assign input image
+        inputNode.image = MaterialUtilities.loadImage(srcTex.getFullPath())
+
         # Assign output image path
         outputNode.base_path = dstTex.getFullPath(path_only=True)
 
@@ -126,6 +488,10 @@ class CompositorUtilities(object):
         # Remove Blender standard '0000' suffix
         CompositorUtilities.removeBlenderFrameSuffix(dstTex)
 
+        # Store the fresh render for future identical calls
+        if cacheKey:
+            CompositorUtilities._storeCachedRender(cacheKey, dstTex)
+
         return dstTex
 
     @staticmethod
@@ -138,6 +504,24 @@ class CompositorUtilities(object):
         :param do_cleanup: bool do clear the compositor node tree after rendering
         :return:
         """
+        # Resolve the source and destination paths first so a cache hit skips all node work
+        srcRgbTex = FilePath(src_rgb)
+        srcRgbPath = srcRgbTex.getFullPath()
+        srcAlphaTex = FilePath(src_greyscale)
+
+        # Reuse an identical previous render from the disk cache when both inputs are unchanged -
+        # rendering in place overwrites the source so those calls can never hit and are not cached
+        dstTex = FilePath(srcRgbPath)
+        dstTex.fileName = dstTex.fileName.replace(expected_src_suffix, dst_suffix)
+        cacheKey = None
+        if dstTex.getFullPath() != srcRgbPath:
+            cacheKey = CompositorUtilities._cacheKey(
+                "packGreyscaleToAlpha",
+                [srcRgbPath, srcAlphaTex.getFullPath()],
+                {"format": format})
+            if CompositorUtilities._fetchCachedRender(cacheKey, dstTex):
+                return
+
         # Switch on nodes and get scene reference
         nodeTree, outputNode = CompositorUtilities.initCompositor()
 
@@ -152,15 +536,10 @@ class CompositorUtilities(object):
         mergeNode = nodeTree.nodes.new(type="CompositorNodeCombineColor")
 
         # Assign input RGB image
-        srcRgbTex = FilePath(src_rgb)
-        img = bpy.data.images.load(srcRgbTex.getFullPath(), check_existing=True)
-        inputRgbNode.image = img
+        inputRgbNode.image = MaterialUtilities.loadImage(srcRgbPath)
 
         # Assign input Greyscale image
-        srcAlphaTex = FilePath(src_greyscale)
-        img = bpy.data.images.load(srcAlphaTex.getFullPath(), check_existing=True)
-        inputAlphaNode.image = img
-        inputAlphaNode.image.colorspace_settings.name = "Non-Color"
+        inputAlphaNode.image = MaterialUtilities.loadImage(srcAlphaTex.getFullPath(), colorspace="Non-Color")
 
         # Connect nodes -
         # link the image pin (0) on the input RGB node to the input pin (0) on the channel split node
@@ -178,12 +557,11 @@ class CompositorUtilities(object):
         nodeTree.links.new(mergeNode.outputs[0], outputNode.inputs[0])
 
         # Assign output image path
-        outputNode.base_path = srcRgbTex.getFullPath(path_only=True)
+        outputNode.base_path = dstTex.getFullPath(path_only=True)
 
         # Assign output image name
-        srcRgbTex.fileName = srcRgbTex.fileName.replace(expected_src_suffix, dst_suffix)
         for filePath in outputNode.file_slots:
-            filePath.path = srcRgbTex.fileName
+            filePath.path = dstTex.fileName
 
         # Assign output file type (extension)
         outputNode.format.file_format = format
@@ -195,7 +573,11 @@ class CompositorUtilities(object):
         CompositorUtilities.renderComposition(nodeTree, do_cleanup=do_cleanup)
 
         # Remove Blender frame suffix eg. '0000'
-        CompositorUtilities.removeBlenderFrameSuffix(srcRgbTex)
+        CompositorUtilities.removeBlenderFrameSuffix(dstTex)
+
+        # Store the fresh render for future identical calls
+        if cacheKey:
+            CompositorUtilities._storeCachedRender(cacheKey, dstTex)
 
     @staticmethod
     def blendImages(src_image_01, src_image_02, mix_type="MULTIPLY", image_01_type="sRGB", image_02_type="sRGB", format="TARGA", do_cleanup=True):
@@ -208,6 +590,11 @@ class CompositorUtilities(object):
         :param do_cleanup: bool do clear the compositor node tree after rendering
         :return:
         """
+        # The blend overwrites src_image_01 in place, so its pre-render state can never be
+        # seen again and disk caching the result would only ever miss - no cache here
+        srcImageTex = FilePath(src_image_01)
+        secondaryImageTex = FilePath(src_image_02)
+
         # Switch on nodes and get scene reference
         nodeTree, outputNode = CompositorUtilities.initCompositor()
 
@@ -219,16 +606,10 @@ class CompositorUtilities(object):
         mixNode = nodeTree.nodes.new(type="CompositorNodeMixRGB")
 
         # Assign input RGB image
-        srcImageTex = FilePath(src_image_01)
-        img = bpy.data.images.load(srcImageTex.getFullPath(), check_existing=True)
-        inputImage01Node.image = img
-        inputImage01Node.image.colorspace_settings.name = image_01_type
+        inputImage01Node.image = MaterialUtilities.loadImage(srcImageTex.getFullPath(), colorspace=image_01_type)
 
         # Assign input Greyscale image
-        secondaryImageTex = FilePath(src_image_02)
-        img = bpy.data.images.load(secondaryImageTex.getFullPath(), check_existing=True)
-        inputImage02Node.image = img
-        inputImage02Node.image.colorspace_settings.name = image_02_type
+        inputImage02Node.image = MaterialUtilities.loadImage(secondaryImageTex.getFullPath(), colorspace=image_02_type)
 
         # Connect nodes -
         # link the image pin (0) on the input RGB node to the input pin (0) on the channel split node
@@ -259,3 +640,213 @@ class CompositorUtilities(object):
 
         # Remove Blender frame suffix eg. '0000'
         CompositorUtilities.removeBlenderFrameSuffix(srcImageTex)
+
+    @staticmethod
+    def blendImagesMulti(src_image_01, src_image_02, mix_types, image_01_type="sRGB", image_02_type="sRGB", format="TARGA", do_cleanup=True):
+        """
+        Method to blend two images with several blend types in a single render -
+        the inputs are loaded and colorspace-assigned once and every blend type gets its own
+        mix node feeding its own output file slot, so N blends cost one decode and one render
+        :param src_image_01: str of file path of first image for blend
+        :param src_image_02: str of file path of second image for blend
+        :param mix_types: list of str image mixing blend types in Blender formatted string eg. ["MULTIPLY", "DARKEN"]
+        :param format: str file format of the output images in Blender formatted string eg. TARGA, PNG, JPEG, TIFF
+        :param do_cleanup: bool do clear the compositor node tree after rendering
+        :return: list of FilePath objects of the rendered destination images, one per blend type
+        """
+        # Switch on nodes and get scene reference
+        nodeTree, outputNode = CompositorUtilities.initCompositor()
+
+        # Create input nodes - shared by every blend branch
+        inputImage01Node = nodeTree.nodes.new(type="CompositorNodeImage")
+        inputImage02Node = nodeTree.nodes.new(type="CompositorNodeImage")
+
+        # Assign input images once for the whole set of blends
+        srcImageTex = FilePath(src_image_01)
+        secondaryImageTex = FilePath(src_image_02)
+        inputImage01Node.image = MaterialUtilities.loadImage(srcImageTex.getFullPath(), colorspace=image_01_type)
+        inputImage02Node.image = MaterialUtilities.loadImage(secondaryImageTex.getFullPath(), colorspace=image_02_type)
+
+        # Assign output image path, file type (extension) and color mode
+        outputNode.base_path = srcImageTex.getFullPath(path_only=True)
+        outputNode.format.file_format = format
+        outputNode.format.color_mode = 'RGBA'
+
+        # One mix node and one file slot per blend type, all fed by the same two inputs
+        dstTexs = []
+        for index, mixType in enumerate(mix_types):
+            mixNode = nodeTree.nodes.new(type="CompositorNodeMixRGB")
+            mixNode.blend_type = mixType
+            nodeTree.links.new(inputImage01Node.outputs[0], mixNode.inputs[1])
+            nodeTree.links.new(inputImage02Node.outputs[0], mixNode.inputs[2])
+
+            # Suffix each destination with its blend type so the outputs are distinct
+            dstTex = FilePath(srcImageTex.getFullPath())
+            dstTex.fileName = '_'.join([srcImageTex.fileName, mixType.lower()])
+            dstTexs.append(dstTex)
+
+            # The output node starts with one default slot, further blends add their own
+            if index == 0:
+                outputNode.file_slots[0].path = dstTex.fileName
+            else:
+                outputNode.file_slots.new(dstTex.fileName)
+            nodeTree.links.new(mixNode.outputs[0], outputNode.inputs[index])
+
+        # Render every blend in one pass
+        CompositorUtilities.renderComposition(nodeTree, do_cleanup=do_cleanup)
+
+        # Remove the Blender frame suffix from every output in one rename pass
+        CompositorUtilities.removeBlenderFrameSuffixes(dstTexs)
+
+        return dstTexs
+
+    # Blender file_format value per output extension for the numpy save path
+    _file_formats_by_ext = {
+        "tga": "TARGA",
+        "png": "PNG",
+        "jpg": "JPEG",
+        "jpeg": "JPEG",
+        "tif": "TIFF",
+        "tiff": "TIFF",
+        "bmp": "BMP",
+        "exr": "OPEN_EXR",
+    }
+
+    # Elementwise blend modes with a direct numpy equivalent - anything else needs the compositor
+    _numpy_blend_ops = {
+        "MULTIPLY": np.multiply,
+        "ADD": np.add,
+        "SUBTRACT": np.subtract,
+        "DARKEN": np.minimum,
+        "LIGHTEN": np.maximum,
+    }
+
+    @staticmethod
+    def _getPixels(img):
+        """
+        Helper to pull an image's pixel buffer into a numpy array in one C call
+        :param img: image data block to read pixels from
+        :return: numpy float32 array of shape (pixel count, channels)
+        """
+        buf = np.empty(img.size[0] * img.size[1] * img.channels, dtype=np.float32)
+        img.pixels.foreach_get(buf)
+        return buf.reshape(-1, img.channels)
+
+    @staticmethod
+    def _savePixels(pixels, width, height, dst, use_alpha=True):
+        """
+        Helper to write a numpy pixel array out as an image file
+        :param pixels: numpy float32 array of shape (pixel count, 4)
+        :param width: int width of the image in pixels
+        :param height: int height of the image in pixels
+        :param dst: FilePath object of the destination image
+        :param use_alpha: bool the output carries an alpha channel
+        :return:
+        """
+        # Encode with the format matching the destination extension -
+        # save_render would use the scene's render settings regardless of the path
+        fileFormat = CompositorUtilities._file_formats_by_ext.get(dst.fileExt.lower())
+        if fileFormat is None:
+            raise ValueError(f"Unsupported output extension [{dst.fileExt}] for a pixel-buffer save")
+
+        outImg = bpy.data.images.new(dst.fileName, width=width, height=height, alpha=use_alpha)
+        outImg.pixels.foreach_set(pixels.ravel())
+        outImg.filepath_raw = dst.getFullPath()
+        outImg.file_format = fileFormat
+        outImg.save()
+
+        # The data block only existed to carry the buffer to disk
+        bpy.data.images.remove(outImg)
+
+    @staticmethod
+    def extractAlphaNumpy(src_img, dst_img):
+        """
+        Method to save the alpha channel of the provided source image as its own greyscale image,
+        operating directly on the pixel buffer - for this purely per-pixel operation the whole
+        node tree and render pipeline of extractAlphaToGreyscale is skipped
+        :param src_img: str file path of the source image
+        :param dst_img: str file path of the destination image
+        :return: FilePath object of the destination image
+        """
+        srcTex = FilePath(src_img)
+        dstTex = FilePath(dst_img)
+
+        img = MaterialUtilities.loadImage(srcTex.getFullPath())
+        width, height = img.size
+
+        # Broadcast the alpha channel into the RGB channels of the output
+        alpha = CompositorUtilities._getPixels(img)[:, 3]
+        out = np.empty((alpha.size, 4), dtype=np.float32)
+        out[:, 0] = out[:, 1] = out[:, 2] = alpha
+        out[:, 3] = 1.0
+
+        CompositorUtilities._savePixels(out, width, height, dstTex, use_alpha=False)
+
+        return dstTex
+
+    @staticmethod
+    def packGreyscaleToAlphaNumpy(src_rgb, src_greyscale, dst_img):
+        """
+        Method to pack a greyscale texture into the alpha channel of an RGBA texture,
+        operating directly on the pixel buffers instead of a compositor render
+        :param src_rgb: str file path of the texture to use as the RGB channels of the output image
+        :param src_greyscale: str file path of the greyscale texture to pack into the Alpha channel of the output image
+        :param dst_img: str file path of the destination image
+        :return: FilePath object of the destination image
+        """
+        srcRgbTex = FilePath(src_rgb)
+        srcAlphaTex = FilePath(src_greyscale)
+        dstTex = FilePath(dst_img)
+
+        rgbImg = MaterialUtilities.loadImage(srcRgbTex.getFullPath())
+        alphaImg = MaterialUtilities.loadImage(srcAlphaTex.getFullPath(), colorspace="Non-Color")
+
+        if tuple(rgbImg.size) != tuple(alphaImg.size):
+            raise ValueError(f"Image sizes do not match: {src_rgb} is {tuple(rgbImg.size)}, {src_greyscale} is {tuple(alphaImg.size)}")
+
+        # Stack the RGB channels of one buffer against the first channel of the other
+        rgb = CompositorUtilities._getPixels(rgbImg)[:, :3]
+        alpha = CompositorUtilities._getPixels(alphaImg)[:, 0]
+        out = np.column_stack((rgb, alpha))
+
+        CompositorUtilities._savePixels(out, rgbImg.size[0], rgbImg.size[1], dstTex)
+
+        return dstTex
+
+    @staticmethod
+    def blendImagesNumpy(src_image_01, src_image_02, mix_type="MULTIPLY", dst_img=None):
+        """
+        Method to blend two images directly on their pixel buffers for blend types that are a
+        plain elementwise operation, falling back to the compositor render for anything else
+        :param src_image_01: str of file path of first image for blend
+        :param src_image_02: str of file path of second image for blend
+        :param mix_type: str of the image mixing blend type in Blender formatted string eg. MULTIPLY, ADD, DARKEN
+        :param dst_img: str file path of the destination image, overwrites src_image_01 when not provided
+        :return: FilePath object of the destination image, None when the compositor fallback was used
+        """
+        # Exotic blend types have no direct numpy equivalent - use the full compositor path.
+        # That path always overwrites src_image_01, so refuse rather than ignore a separate destination
+        blendOp = CompositorUtilities._numpy_blend_ops.get(mix_type)
+        if blendOp is None:
+            if dst_img:
+                raise ValueError(f"Blend type [{mix_type}] needs the compositor fallback, which cannot write to a separate destination")
+            CompositorUtilities.blendImages(src_image_01, src_image_02, mix_type=mix_type)
+            return None
+
+        srcTex = FilePath(src_image_01)
+        secondaryTex = FilePath(src_image_02)
+        dstTex = FilePath(dst_img) if dst_img else FilePath(srcTex.getFullPath())
+
+        img01 = MaterialUtilities.loadImage(srcTex.getFullPath())
+        img02 = MaterialUtilities.loadImage(secondaryTex.getFullPath())
+
+        if tuple(img01.size) != tuple(img02.size):
+            raise ValueError(f"Image sizes do not match: {src_image_01} is {tuple(img01.size)}, {src_image_02} is {tuple(img02.size)}")
+
+        # Blend the RGB channels, keeping the alpha of the first image as the compositor does
+        out = CompositorUtilities._getPixels(img01).copy()
+        out[:, :3] = blendOp(out[:, :3], CompositorUtilities._getPixels(img02)[:, :3])
+
+        CompositorUtilities._savePixels(out, img01.size[0], img01.size[1], dstTex)
+
+        return dstTex
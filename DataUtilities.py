@@ -1,4 +1,5 @@
 import bpy
+from Utilities.Blender.MaterialUtilities import MaterialUtilities
 
 
 class DataUtilities(object):
@@ -20,27 +21,31 @@ class DataUtilities(object):
         # Get the collection from its name
         objects = bpy.data.collections[collection_name].objects
 
-        # Will collect meshes from delete objects
-        meshes = set()
-
-        # Get objects in the collection if they are meshes store the mesh to delete later and then delete the object
-        for obj in objects:
-            if obj.type == "MESH":
-                meshes.add(obj.data)
+        # Remove the objects in the collection - snapshot first as removal mutates the collection
+        for obj in list(objects):
             bpy.data.objects.remove(obj)
 
-        if remove_meshes:
-            # Look at meshes that are orphan after objects removal
-            for mesh in [m for m in meshes if m.users == 0]:
-                # Delete the meshes
-                bpy.data.meshes.remove(mesh)
+        # Flag data block types the caller wants kept as fake users so the purge skips them,
+        # only touching blocks that were not already flagged by the user
+        keep = []
+        if not remove_meshes:
+            keep.extend(m for m in bpy.data.meshes if not m.use_fake_user)
+        if not remove_materials:
+            keep.extend(mat for mat in bpy.data.materials if not mat.use_fake_user)
+        if not remove_images:
+            keep.extend(i for i in bpy.data.images if not i.use_fake_user)
+
+        for block in keep:
+            block.use_fake_user = True
+
+        # Drop the shared image cache before the sweep - the purge can free zero-user images
+        # and a stale cache entry would hand back a removed data block on the next load
+        if remove_images:
+            MaterialUtilities._image_cache.clear()
 
-        if remove_materials:
-            # Look at materials that are orphans since meshes have been deleted
-            for material in [mat for mat in bpy.data.materials if mat.users == 0]:
-                bpy.data.materials.remove(material)
+        # One recursive C-level sweep replaces the per-type Python orphan scans and also
+        # catches orphans that cascade from freed meshes and materials
+        bpy.data.orphans_purge(do_local_ids=True, do_linked_ids=False, do_recursive=True)
 
-        if remove_images:
-            # Look at materials that are orphans since materials have been deleted
-            for image in [i for i in bpy.data.images if i.users == 0]:
-                bpy.data.images.remove(image)
+        for block in keep:
+            block.use_fake_user = False
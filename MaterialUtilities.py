@@ -1,22 +1,87 @@
 import bpy
+import os
+import weakref
 from Utilities.Enums.DCCs import BlenderMaterialTextureSlots
 
 
 class MaterialUtilities(object):
 
+    # Memoized Principled BSDF node per material - weak keys so freed materials drop their entry
+    _bsdf_cache = weakref.WeakKeyDictionary()
+
+    # Process-local image cache keyed by normalized absolute path -> (image, mtime at load time)
+    _image_cache = {}
+
+    @staticmethod
+    def loadImage(path, colorspace=None):
+        """
+        Method to load an image through a process-local cache shared by the material and compositor
+        utilities, skipping the path resolution and header parse of bpy.data.images.load
+        when the same texture is used many times
+        :param path: str file path of the image to load
+        :param colorspace: str Blender colorspace name to assign eg. Non-Color - only applied when it differs
+        :return: loaded image data block
+        """
+        key = os.path.realpath(path)
+        mtime = os.path.getmtime(key)
+
+        cached = MaterialUtilities._image_cache.get(key)
+        if cached and cached[1] == mtime:
+            img = cached[0]
+        else:
+            img = bpy.data.images.load(key, check_existing=True)
+            # The data block already existed but the file changed on disk, pull in the new pixels
+            if cached:
+                img.reload()
+            MaterialUtilities._image_cache[key] = (img, mtime)
+
+        # Only touch the colorspace when it differs to avoid a needless update
+        if colorspace and img.colorspace_settings.name != colorspace:
+            img.colorspace_settings.name = colorspace
+
+        return img
+
+    @staticmethod
+    def _getBsdf(material):
+        """
+        Helper to get the Principled BSDF node of a material, memoized so repeat calls
+        skip the by-name scan of the node collection
+        :param material: material to get the Principled BSDF node from
+        :return: the Principled BSDF node, None if the material has none
+        """
+        bsdf = MaterialUtilities._bsdf_cache.get(material)
+
+        if bsdf is None:
+            bsdf = material.node_tree.nodes.get("Principled BSDF", None)
+            if bsdf is not None:
+                MaterialUtilities._bsdf_cache[material] = bsdf
+
+        return bsdf
+
     @staticmethod
     def getTextures(objects):
         """
             Return paths for all textures inside an objects active material
         :param objects:
         """
-        images = []
+        return list(MaterialUtilities.iterTextures(objects))
 
-        for mesh in [o for o in objects if o.type == "MESH"]:
-            for textureNode in [node for node in mesh.active_material.node_tree.nodes if node.type == "TEX_IMAGE"]:
-                images.append(textureNode.image.filepath)
+    @staticmethod
+    def iterTextures(objects):
+        """
+            Yield paths for all textures inside an objects active material one at a time,
+            without materializing intermediate lists - suited to streaming over large selections
+        :param objects:
+        """
+        for mesh in objects:
+            # Skip non-meshes and meshes with no material assigned
+            if mesh.type != "MESH" or not mesh.active_material:
+                continue
 
-        return images
+            # Resolve the node collection once per mesh
+            for textureNode in mesh.active_material.node_tree.nodes:
+                if textureNode.type == "TEX_IMAGE" and textureNode.image:
+                    yield textureNode.image.filepath
 
     @staticmethod
     def getTextureFromSlot(material, slot: BlenderMaterialTextureSlots):
@@ -28,7 +93,7 @@ class MaterialUtilities(object):
         To get the texture file path from the returned node, use node.image.filepath
         """
         # Get the Principled BSDF node
-        shaderGraph = material.node_tree.nodes.get("Principled BSDF", None)
+        shaderGraph = MaterialUtilities._getBsdf(material)
 
         # Get the node linked to the provided input slot
         if shaderGraph.inputs[slot.value].links:
@@ -53,26 +118,24 @@ class MaterialUtilities(object):
         :return: bool if assignment is successful or failed
         """
 
-        # If no texture node was provided, get an existing texture link and assign the new image
-        if not texture_node:
-            texture_node = MaterialUtilities.getTextureFromSlot(material, slot)
-            if texture_node:
-                # Load the image
-                img = bpy.data.images.load(texture_path, check_existing=True)
-                # Assign the image
-                texture_node.image = img
-                return True
+        # Get the memoized Principled BSDF node and the target input slot once
+        shaderGraph = MaterialUtilities._getBsdf(material)
+        inputSlot = shaderGraph.inputs[slot.value]
 
-        # Get the Principled BSDF node
-        shaderGraph = material.node_tree.nodes.get("Principled BSDF", None)
-        inputNode = shaderGraph.inputs[slot.value]
+        # Use the provided node, otherwise reuse whatever is already linked to the slot
+        texture_node = texture_node or MaterialUtilities.getTextureFromSlot(material, slot)
 
-        # If no texture node was provided and no existing link was found, create a new link
+        # An existing node just gets the new image assigned through the shared cache
+        if texture_node and texture_path:
+            texture_node.image = MaterialUtilities.loadImage(texture_path)
+
+        # Nothing provided or linked - create a fresh texture node
         if not texture_node:
             texture_node = MaterialUtilities.createTextureNode(material.node_tree, texture_path)
 
-        # Connect the texture to the material input slot
-        material.node_tree.links.new(texture_node.outputs[0], inputNode)
+        # Connect the texture to the material input slot when it is not already linked
+        if not inputSlot.links:
+            material.node_tree.links.new(texture_node.outputs[0], inputSlot)
 
         return True
 
@@ -87,10 +150,7 @@ class MaterialUtilities(object):
         # Create the texture node
         texNode = node_tree.nodes.new(type="ShaderNodeTexImage")
 
-        # Load the texture image
-        img = bpy.data.images.load(texture_path, check_existing=True)
-
-        # Assign the image to the texture node
-        texNode.image = img
+        # Load the texture image through the shared cache and assign it to the texture node
+        texNode.image = MaterialUtilities.loadImage(texture_path)
 
         return texNode
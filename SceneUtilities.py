@@ -1,5 +1,6 @@
 import bpy
 import mathutils
+from collections import deque
 from math import radians
 
 class SceneUtilities(object):
@@ -16,15 +17,14 @@ class SceneUtilities(object):
         """
         # If a specific collection is provided
         if collection:
-            camCollection = [x for x in bpy.data.collections if collection == x.name]
+            # O(1) hashed lookup by name instead of a linear scan over all collections
+            camCollection = bpy.data.collections.get(collection)
             # Create that collection if it does not exist
             if not camCollection:
                 # Create collection
                 camCollection = bpy.data.collections.new(collection)
                 # Link it to the active scene
                 bpy.context.scene.collection.children.link(camCollection)
-            else:
-                camCollection = camCollection[0]
         # Use active collection if none provided
         else:
             camCollection = bpy.context.view_layer.active_layer_collection.collection
@@ -48,9 +48,9 @@ class SceneUtilities(object):
         # Create Object parent
         camera = bpy.data.objects.new(name, camera)
 
-        # Position camera
+        # Position camera - assign an Euler directly rather than a list Blender must convert
         camera.location = location
-        camera.rotation_euler = [radians(x) for x in rotation]
+        camera.rotation_euler = mathutils.Euler((radians(rotation[0]), radians(rotation[1]), radians(rotation[2])), 'XYZ')
 
         # bpy.context.scene.collection.objects.link(cam) # scene.collection is the ROOT 'Scene Collection' collection
 
@@ -85,55 +85,101 @@ class SceneUtilities(object):
         camera.location = camera.location + vec @ inv
 
     @staticmethod
-    def selectChildren(parent, recursive=True, select_parent=False):
+    def buildChildrenIndex(scene=None):
+        """
+        Method to index the parent/child relationships of a whole scene in one pass -
+        every .children access in bpy scans all scene objects, so traversals that touch
+        many parents should build this once and pass it in rather than pay that scan per node
+        :param scene: scene to index, defaults to the active scene
+        :return: dict mapping parent object name to a list of its child objects
+        """
+        if scene is None:
+            scene = bpy.context.scene
+
+        index = {}
+        for obj in scene.objects:
+            if obj.parent:
+                index.setdefault(obj.parent.name, []).append(obj)
+
+        return index
+
+    @staticmethod
+    def _getChildrenOf(obj, children_index):
+        """
+        Helper to get an object's direct children, from the prebuilt index when one is provided
+        :param obj: object whose children are returned
+        :param children_index: dict from buildChildrenIndex, None to fall back to .children
+        :return: the object's direct children
+        """
+        if children_index is None:
+            return obj.children
+
+        return children_index.get(obj.name, ())
+
+    @staticmethod
+    def selectChildren(parent, recursive=True, select_parent=False, children_index=None):
         """
         Recursively select children
         :param recursive: Enable selecting children recursively to select all children
         :param parent: Parent object whose children are selected
         :param select_parent: bool
+        :param children_index: optional dict from buildChildrenIndex to avoid per-node .children scans
         """
         if select_parent:
             parent.select_set(True)
 
-        for child in parent.children:
+        # Walk the hierarchy breadth-first with an explicit queue - no recursion depth limit
+        queue = deque(SceneUtilities._getChildrenOf(parent, children_index))
+        while queue:
+            child = queue.popleft()
             child.select_set(True)
             if recursive:
-                SceneUtilities.selectChildren(child, True)
+                queue.extend(SceneUtilities._getChildrenOf(child, children_index))
 
     @staticmethod
-    def getChildren(parent, include_meshes=True, recursive=True):
+    def getChildren(parent, include_meshes=True, recursive=True, children_index=None):
         """
         Recursively select children
         :param parent: Parent object whose children are selected
         :param include_meshes:
         :param recursive: Enable selecting children recursively to select all children
+        :param children_index: optional dict from buildChildrenIndex to avoid per-node .children scans
         """
         children = []
-        for child in parent.children:
+
+        # Walk the hierarchy breadth-first with an explicit queue - no recursion depth limit
+        queue = deque(SceneUtilities._getChildrenOf(parent, children_index))
+        while queue:
+            child = queue.popleft()
             children.append(child)
             if include_meshes and child.data:
                 children.append(child.data)
             if recursive:
-                children.extend(SceneUtilities.getChildren(child, recursive=True))
+                queue.extend(SceneUtilities._getChildrenOf(child, children_index))
+
         return children
 
     @staticmethod
-    def getChildMeshes(parent, recursive=True, include_root=True):
+    def getChildMeshes(parent, recursive=True, include_root=True, children_index=None):
         """
         Recursively select children
         :param parent: Parent object whose children are selected
         :param recursive: Enable selecting children recursively to select all children
+        :param children_index: optional dict from buildChildrenIndex to avoid per-node .children scans
         """
         children = []
 
         if include_root and parent.data:
             children.append(parent.data)
 
-        for child in parent.children:
+        # Walk the hierarchy breadth-first with an explicit queue - no recursion depth limit
+        queue = deque(SceneUtilities._getChildrenOf(parent, children_index))
+        while queue:
+            child = queue.popleft()
             if child.data:
                 children.append(child.data)
             if recursive:
-                children.extend(SceneUtilities.getChildMeshes(child, recursive=True, include_root=False))
+                queue.extend(SceneUtilities._getChildrenOf(child, children_index))
 
         return children
 
@@ -161,31 +207,38 @@ class SceneUtilities(object):
         :param secondary_parent:
         :return:
         """
-        # Clear any existing selection
-        bpy.ops.object.select_all(action='DESELECT')
-
-        # Select all objects to merge
-        SceneUtilities.selectChildren(active_parent, select_parent=True)
-        SceneUtilities.selectChildren(secondary_parent, select_parent=True)
-
-        # Set the merge context
-        sceneMeshes = [m for m in bpy.context.scene.objects if m.type == 'MESH']
-        print(f'Scene meshes: {[x.name for x in sceneMeshes]}')
-
-        # Find a mesh object child of the active parent object
-        for mesh in sceneMeshes:
-            # Make the first mesh found under the active parent hierarchy the active object
-            if mesh.name == active_parent.name:
-                print(f'JOIN from mesh: mesh name - {mesh.name}')
-                bpy.context.view_layer.objects.active = mesh
-                break
-            elif mesh.parent and active_parent.name == mesh.parent.name:
-                print(f'JOIN: parent name - {mesh.parent.name} from mesh {mesh.name}')
-                bpy.context.view_layer.objects.active = mesh
-                break
+        # Clear any existing selection - deselecting only what is selected skips the operator round-trip
+        for obj in bpy.context.selected_objects:
+            obj.select_set(False)
+
+        # Collect both hierarchies up front and select everything in one pass,
+        # sharing one scene-wide children index between the traversals
+        childrenIndex = SceneUtilities.buildChildrenIndex()
+        targets = [active_parent, secondary_parent]
+        targets.extend(SceneUtilities.getChildren(active_parent, include_meshes=False, children_index=childrenIndex))
+        targets.extend(SceneUtilities.getChildren(secondary_parent, include_meshes=False, children_index=childrenIndex))
+        for obj in targets:
+            obj.select_set(True)
+
+        # Index scene meshes by their own name and their parent name in one scan -
+        # replaces the per-call linear name search over all scene objects
+        meshesByParent = {}
+        for mesh in bpy.context.scene.objects:
+            if mesh.type == 'MESH':
+                meshesByParent.setdefault(mesh.name, mesh)
+                if mesh.parent:
+                    meshesByParent.setdefault(mesh.parent.name, mesh)
+
+        # Make the first mesh found under the active parent hierarchy the active object
+        activeMesh = meshesByParent.get(active_parent.name)
+        if activeMesh:
+            print(f'JOIN from mesh: mesh name - {activeMesh.name}')
+            bpy.context.view_layer.objects.active = activeMesh
+
         # Merge the meshes and clear selection
         bpy.ops.object.join()
-        bpy.ops.object.select_all(action='DESELECT')
+        for obj in bpy.context.selected_objects:
+            obj.select_set(False)
         
         # Cleanup empties
         if cleanup_empties: